@@ -1,21 +1,182 @@
 """Provides a low-level interface for metadata media APIs."""
 
+import asyncio
 import datetime
-from re import match
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
+from pathlib import Path
+from re import compile as re_compile
 from time import sleep
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import urlparse
 
+from mnamer.const import CACHE_PATH
 from mnamer.exceptions import (
     MnamerException,
     MnamerNetworkException,
     MnamerNotFoundException,
 )
 from mnamer.language import Language
-from mnamer.utils import clean_dict, parse_date, request_json
+from mnamer.utils import parse_date, request_json
 
 OMDB_PLOT_TYPES = {"short", "long"}
 MAX_RETRIES = 5
 TVDB_V4_BASE = "https://api4.thetvdb.com/v4"
+_TMDB_V3 = "https://api.themoviedb.org/3"
+_TMDB_FIND = f"{_TMDB_V3}/find/{{}}"
+_TMDB_MOVIE = f"{_TMDB_V3}/movie/{{}}"
+_TMDB_SEARCH_MOVIES = f"{_TMDB_V3}/search/movie"
+_TMDB_FIND_SOURCES = frozenset(
+    {"imdb_id", "freebase_mid", "freebase_id", "tvdb_id", "tvrage_id"}
+)
+_TMDB_FIND_RESULT_KEYS = (
+    "movie_results",
+    "person_results",
+    "tv_episode_results",
+    "tv_results",
+    "tv_season_results",
+)
+_IMDB_RE = re_compile(r"^tt\d+$")
+_TVDB_REMOTE_ROUTES = {
+    "id_imdb": "/search/remoteid/{}",
+    "id_zap2it": "/search/remoteid/{}",
+}
+
+
+class _HostLimiter:
+    """Token bucket that paces requests to a provider host client-side."""
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    float(self.rate),
+                    self.tokens + (now - self.updated) * self.rate / self.per,
+                )
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) * self.per / self.rate
+            sleep(wait)
+
+
+_LIMITERS: dict[str, _HostLimiter] = {
+    "api.tvmaze.com": _HostLimiter(20, 10),
+    "api.themoviedb.org": _HostLimiter(40, 1),
+    "api4.thetvdb.com": _HostLimiter(30, 1),
+}
+
+
+def _paced_request_json(
+    url,
+    parameters: dict | list | None = None,
+    body: dict | None = None,
+    headers: dict | None = None,
+    cache: bool = True,
+) -> tuple[int, dict]:
+    """Applies the host's client-side rate limit when a fetch hits the network."""
+    limiter = _LIMITERS.get(urlparse(url).hostname or "")
+    return request_json(
+        url,
+        parameters,
+        body=body,
+        headers=headers,
+        cache=cache,
+        pace=limiter.acquire if limiter else None,
+    )
+
+
+_INFLIGHT: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _freeze(mapping: dict | list | None) -> tuple:
+    if isinstance(mapping, dict):
+        return tuple(sorted((str(k), str(v)) for k, v in mapping.items()))
+    if isinstance(mapping, list):
+        return tuple(mapping)
+    return ()
+
+
+def _bounded_request_json(
+    url,
+    parameters: dict | list | None = None,
+    body: dict | None = None,
+    headers: dict | None = None,
+    cache: bool = True,
+) -> tuple[int, dict]:
+    """
+    Rate-limits requests and collapses identical concurrent lookups into a
+    single network call whose response all callers share.
+    """
+    if body is not None:
+        return _paced_request_json(url, parameters, body, headers, cache)
+    key = (url, _freeze(parameters), _freeze(headers), cache)
+    with _inflight_lock:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _INFLIGHT[key] = future
+    if not leader:
+        return future.result()
+    try:
+        result = _paced_request_json(url, parameters, body, headers, cache)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _INFLIGHT.pop(key, None)
+
+
+_TOKEN_TTL = 24 * 3600  # TVDb JWTs are valid for ~1 month; refresh daily
+_TOKEN_CACHE: dict[str, tuple[str, float]] = {}
+_TOKEN_CACHE_PATH = Path(f"{CACHE_PATH}-tvdb-token.json")
+_token_cache_loaded = False
+
+
+def _get_cached_token(api_key: str) -> str | None:
+    global _token_cache_loaded
+    if not _token_cache_loaded:
+        _token_cache_loaded = True
+        try:
+            with open(_TOKEN_CACHE_PATH) as fp:
+                for key, (token, expiry) in json.load(fp).items():
+                    _TOKEN_CACHE[key] = (token, float(expiry))
+        except (OSError, TypeError, ValueError):
+            pass
+    entry = _TOKEN_CACHE.get(api_key)
+    if entry and time.time() < entry[1]:
+        return entry[0]
+    return None
+
+
+def _store_cached_token(api_key: str, token: str) -> None:
+    _TOKEN_CACHE[api_key] = (token, time.time() + _TOKEN_TTL)
+    try:
+        _TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = _TOKEN_CACHE_PATH.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(_TOKEN_CACHE))
+        os.replace(temp_path, _TOKEN_CACHE_PATH)
+    except OSError:
+        pass
 
 
 def omdb_title(
@@ -49,8 +210,7 @@ def omdb_title(
         "type": media,
         "plot": plot,
     }
-    parameters = clean_dict(parameters)
-    status, content = request_json(url, parameters, cache=cache)
+    status, content = _bounded_request_json(url, parameters, cache=cache)
     error = content.get("Error") if isinstance(content, dict) else None
     if status == 401:
         if error == "Request limit reached!":
@@ -86,8 +246,7 @@ def omdb_search(
         "type": media,
         "page": page,
     }
-    parameters = clean_dict(parameters)
-    status, content = request_json(url, parameters, cache=cache)
+    status, content = _bounded_request_json(url, parameters, cache=cache)
     if status == 401:
         raise MnamerException("invalid API key")
     elif content and not content.get("totalResults"):
@@ -113,30 +272,23 @@ def tmdb_find(
 
     Online docs: developers.themoviedb.org/3/find.
     """
-    sources = ["imdb_id", "freebase_mid", "freebase_id", "tvdb_id", "tvrage_id"]
-    if external_source not in sources:
-        raise MnamerException(f"external_source must be in {sources}")
-    if external_source == "imdb_id" and not match(r"tt\d+", external_id):
+    if external_source not in _TMDB_FIND_SOURCES:
+        raise MnamerException(
+            f"external_source must be in {sorted(_TMDB_FIND_SOURCES)}"
+        )
+    if external_source == "imdb_id" and not _IMDB_RE.match(external_id):
         raise MnamerException("invalid imdb tt-const value")
-    url = "https://api.themoviedb.org/3/find/" + external_id or ""
-    parameters = {
-        "api_key": api_key,
-        "external_source": external_source,
-        "language": language,
-    }
-    keys = [
-        "movie_results",
-        "person_results",
-        "tv_episode_results",
-        "tv_results",
-        "tv_season_results",
-    ]
-    status, content = request_json(url, parameters, cache=cache)
+    url = _TMDB_FIND.format(external_id)
+    parameters = {"api_key": api_key, "external_source": external_source}
+    if language:
+        parameters["language"] = language
+    status, content = _bounded_request_json(url, parameters, cache=cache)
+    has_content = bool(content)
     if status == 401:
         raise MnamerException("invalid API key")
-    elif status != 200 or not any(content.keys()):  # pragma: no cover
+    elif status != 200 or not has_content:  # pragma: no cover
         raise MnamerNetworkException("TMDb down or unavailable?")
-    elif status == 404 or not any(content.get(k, {}) for k in keys):
+    elif status == 404 or not any(content.get(k) for k in _TMDB_FIND_RESULT_KEYS):
         raise MnamerNotFoundException
     return content
 
@@ -152,14 +304,16 @@ def tmdb_movies(
 
     Online docs: developers.themoviedb.org/3/movies.
     """
-    url = f"https://api.themoviedb.org/3/movie/{id_tmdb}"
-    parameters = {"api_key": api_key, "language": language}
-    status, content = request_json(url, parameters, cache=cache)
+    url = _TMDB_MOVIE.format(id_tmdb)
+    parameters = {"api_key": api_key}
+    if language:
+        parameters["language"] = language
+    status, content = _bounded_request_json(url, parameters, cache=cache)
     if status == 401:
         raise MnamerException("invalid API key")
     elif status == 404:
         raise MnamerNotFoundException
-    elif status != 200 or not any(content.keys()):  # pragma: no cover
+    elif status != 200 or not content:  # pragma: no cover
         raise MnamerNetworkException("TMDb down or unavailable?")
     return content
 
@@ -179,32 +333,41 @@ def tmdb_search_movies(
 
     Online docs: developers.themoviedb.org/3/search/search-movies.
     """
-    url = "https://api.themoviedb.org/3/search/movie"
+    url = _TMDB_SEARCH_MOVIES
     parameters = {
         "api_key": api_key,
         "query": title,
         "page": page,
         "include_adult": adult,
-        "language": language,
-        "region": region,
-        "year": year,
     }
-    status, content = request_json(url, parameters, cache=cache)
+    if language:
+        parameters["language"] = language
+    if region:
+        parameters["region"] = region
+    if year:
+        parameters["year"] = year
+    status, content = _bounded_request_json(url, parameters, cache=cache)
     if status == 401:
         raise MnamerException("invalid API key")
-    elif status != 200 or not any(content.keys()):  # pragma: no cover
+    elif status != 200 or not content:  # pragma: no cover
         raise MnamerNetworkException("TMDb down or unavailable?")
     elif status == 404 or status == 422 or not content.get("total_results"):
         raise MnamerNotFoundException
     return content
 
 
-def tvdb_login(api_key: str | None) -> str:
+def tvdb_login(api_key: str | None, cache: bool = True) -> str:
     """
     Logs into TVDb using the provided api key.
 
+    Note: Tokens are reused for up to a day so repeat invocations skip the
+    login round-trip; pass cache=False to force a fresh login.
     Note: You can register for a free TVDb key at thetvdb.com/?tab=apiregister
     """
+    if cache and api_key:
+        token = _get_cached_token(api_key)
+        if token:
+            return token
     body = {"apikey": api_key}
     status, content = tvdb_request_json("/login", body=body, cache=False)
     data = tvdb_v4_data(content)
@@ -213,6 +376,8 @@ def tvdb_login(api_key: str | None) -> str:
         raise MnamerException("invalid api key")
     elif status != 200 or not token:  # pragma: no cover
         raise MnamerNetworkException("TVDb down or unavailable?")
+    if cache and api_key:
+        _store_cached_token(api_key, token)
     return token
 
 
@@ -231,9 +396,26 @@ def tvdb_refresh_token(token: str) -> str:
         return token
     elif status != 200 or not refreshed:  # pragma: no cover
         raise MnamerNetworkException("TVDb down or unavailable?")
+    for api_key, (cached_token, _expiry) in tuple(_TOKEN_CACHE.items()):
+        if cached_token == token:
+            _store_cached_token(api_key, refreshed)
+            break
     return refreshed
 
 
+# Memoizes whether the host serves /extended per resource type so the
+# guaranteed-404 fallback round-trip is only ever paid once per process.
+_TVDB_EXTENDED_OK: dict[str, bool] = {}
+
+
+def _tvdb_extended_paths(resource: str, id_tvdb: str) -> tuple[str, ...]:
+    """Orders lookup paths, skipping /extended once it's known unavailable."""
+    base = f"/{resource}/{id_tvdb}"
+    if _TVDB_EXTENDED_OK.get(resource) is False:
+        return (base,)
+    return (f"{base}/extended", base)
+
+
 def tvdb_episodes_id(
     token: str,
     id_tvdb: str,
@@ -248,21 +430,30 @@ def tvdb_episodes_id(
     Language.ensure_valid_for_tvdb(language)
     _ensure_numeric_id(id_tvdb, "id_tvdb")
 
-    for path in (f"/episodes/{id_tvdb}/extended", f"/episodes/{id_tvdb}"):
+    extended_missing = False
+    for path in _tvdb_extended_paths("episodes", id_tvdb):
         status, content = tvdb_request_json(
             path,
             token=token,
             language=language,
             cache=cache,
         )
+        extended = path.endswith("/extended")
         if status == 401:
             raise MnamerException("invalid token")
         if status == 429:
             raise MnamerNetworkException("TVDb rate limited, try again later")
         if status == 404:
+            extended_missing = extended
             continue
         if status != 200:
             raise MnamerNetworkException("TVDb down or unavailable?")
+        if extended:
+            _TVDB_EXTENDED_OK["episodes"] = True
+        elif extended_missing:
+            # the base route resolves the id, so the 404 really was the
+            # /extended route itself and not a nonexistent id
+            _TVDB_EXTENDED_OK["episodes"] = False
         payload = _tvdb_normalize_episode_entry(tvdb_v4_data(content))
         if not payload:
             raise MnamerNotFoundException
@@ -285,21 +476,30 @@ def tvdb_series_id(
     Language.ensure_valid_for_tvdb(language)
     _ensure_numeric_id(id_tvdb, "id_tvdb")
 
-    for path in (f"/series/{id_tvdb}/extended", f"/series/{id_tvdb}"):
+    extended_missing = False
+    for path in _tvdb_extended_paths("series", id_tvdb):
         status, content = tvdb_request_json(
             path,
             token=token,
             language=language,
             cache=cache,
         )
+        extended = path.endswith("/extended")
         if status == 401:
             raise MnamerException("invalid token")
         if status == 429:
             raise MnamerNetworkException("TVDb rate limited, try again later")
         if status == 404:
+            extended_missing = extended
             continue
         if status != 200:
             raise MnamerNetworkException("TVDb down or unavailable?")
+        if extended:
+            _TVDB_EXTENDED_OK["series"] = True
+        elif extended_missing:
+            # the base route resolves the id, so the 404 really was the
+            # /extended route itself and not a nonexistent id
+            _TVDB_EXTENDED_OK["series"] = False
         payload = _tvdb_normalize_series_entry(tvdb_v4_data(content))
         if not payload:
             raise MnamerNotFoundException
@@ -402,6 +602,52 @@ def tvdb_series_id_episodes_query(
     return {"data": data, "links": _tvdb_normalize_links(content.get("links"), page)}
 
 
+def tvdb_iter_series_episodes(
+    token: str,
+    id_tvdb: str,
+    episode: int | None = None,
+    season: int | None = None,
+    language: Language | None = None,
+    cache: bool = True,
+):
+    """
+    Yields episodes for a series across all pages, prefetching the next page
+    in the background while the caller consumes the current one so pagination
+    round-trips overlap with client-side processing.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(
+            tvdb_series_id_episodes_query,
+            token,
+            id_tvdb,
+            episode,
+            season,
+            page=1,
+            language=language,
+            cache=cache,
+        )
+        while True:
+            response = future.result()
+            next_page = response["links"].get("next")
+            if next_page:
+                future = executor.submit(
+                    tvdb_series_id_episodes_query,
+                    token,
+                    id_tvdb,
+                    episode,
+                    season,
+                    page=next_page,
+                    language=language,
+                    cache=cache,
+                )
+            yield from response["data"]
+            if not next_page:
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def tvdb_search_series(
     token: str,
     series: str | None = None,
@@ -418,11 +664,11 @@ def tvdb_search_series(
     Language.ensure_valid_for_tvdb(language)
     if not any((series, id_imdb, id_zap2it)):
         raise MnamerException("one of series, id_imdb, id_zap2it must be specified")
-    if sum(1 for v in (series, id_imdb, id_zap2it) if v) > 1:
+    if (bool(series) + bool(id_imdb) + bool(id_zap2it)) > 1:
         raise MnamerException(
             "series, id_imdb, id_zap2it parameters are mutually exclusive"
         )
-    if id_imdb and not match(r"tt\d+", id_imdb):
+    if id_imdb and not _IMDB_RE.match(id_imdb):
         raise MnamerException("invalid imdb tt-const value")
 
     query_value = series or id_imdb or id_zap2it
@@ -430,16 +676,19 @@ def tvdb_search_series(
     attempts = [
         ("/search", {"q": query_value, "query": query_value, "type": "series"}),
     ]
-    if id_imdb:
-        attempts.append((f"/search/remoteid/{id_imdb}", None))
-    elif id_zap2it:
-        attempts.append((f"/search/remoteid/{id_zap2it}", None))
+    for key, value in (("id_imdb", id_imdb), ("id_zap2it", id_zap2it)):
+        if value:
+            attempts.append((_TVDB_REMOTE_ROUTES[key].format(value), None))
+            break
 
     status, content = _tvdb_request_first_available(
         token=token,
         language=language,
         cache=cache,
         attempts=attempts,
+        # remote-id lookups carry a fallback route; overlap the round trips
+        # instead of waiting out a search miss before trying the next path
+        parallel=len(attempts) > 1,
     )
     if status == 401:
         raise MnamerException("invalid token")
@@ -474,12 +723,10 @@ def tvdb_request_json(
     cache: bool = True,
 ) -> tuple[int, dict]:
     """Wrapper for TVDb v4 requests."""
-    headers = {}
+    headers = dict(_tvdb_lang_header(language.a2 if language else None))
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    if language:
-        headers["Accept-Language"] = language.a2
-    return request_json(
+    return _bounded_request_json(
         f"{TVDB_V4_BASE}{path}",
         parameters=params,
         body=body,
@@ -488,6 +735,12 @@ def tvdb_request_json(
     )
 
 
+@lru_cache(maxsize=8)
+def _tvdb_lang_header(a2: str | None) -> tuple[tuple[str, str], ...]:
+    """Returns the frozen Accept-Language header pairs for a language code."""
+    return (("Accept-Language", a2),) if a2 else ()
+
+
 def tvdb_v4_data(content: dict) -> dict | list:
     """Extracts v4 `data` payloads while tolerating malformed responses."""
     if not isinstance(content, dict):
@@ -495,8 +748,19 @@ def tvdb_v4_data(content: dict) -> dict | list:
     return content.get("data") or {}
 
 
+def _is_ascii_digits(value) -> bool:
+    """
+    Returns True for values made up exclusively of ASCII digits; unlike
+    str.isdigit alone this rejects other Unicode decimals that int() can't
+    necessarily round-trip.
+    """
+    if isinstance(value, int):
+        return True
+    return isinstance(value, str) and value.isascii() and value.isdigit()
+
+
 def _ensure_numeric_id(value: str, parameter_name: str) -> None:
-    if not str(value).isdigit():
+    if not _is_ascii_digits(value):
         raise MnamerException(f"invalid {parameter_name}")
 
 
@@ -505,11 +769,39 @@ def _tvdb_request_first_available(
     language: Language | None,
     cache: bool,
     attempts: list[tuple[str, dict | None]],
+    parallel: bool = False,
 ) -> tuple[int, dict]:
     """
     Returns the first non-404/405 response from a list of TVDb request attempts.
+
+    When parallel is set the attempts are issued concurrently and the first
+    usable response wins, overlapping the fallback round-trips; the default
+    serial walk avoids spending quota when the first path is a cache hit.
     """
     fallback = (404, {})
+    if parallel and len(attempts) > 1:
+        executor = ThreadPoolExecutor(max_workers=len(attempts))
+        try:
+            futures = [
+                executor.submit(
+                    tvdb_request_json,
+                    path,
+                    token=token,
+                    params=params,
+                    language=language,
+                    cache=cache,
+                )
+                for path, params in attempts
+            ]
+            for future in as_completed(futures):
+                status, content = future.result()
+                if status in (404, 405):
+                    fallback = (status, content)
+                    continue
+                return status, content
+            return fallback
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     for path, params in attempts:
         status, content = tvdb_request_json(
             path,
@@ -529,15 +821,32 @@ def _tvdb_extract_page(value: int | str | None) -> int | None:
     if isinstance(value, int):
         return value
     if isinstance(value, str):
-        if value.isdigit():
-            return int(value)
-        parsed = parse_qs(urlparse(value).query)
-        page = parsed.get("page", [None])[0]
-        if page and str(page).isdigit():
-            return int(page)
+        return _extract_page_cached(value)
     return None
 
 
+@lru_cache(maxsize=256)
+def _extract_page_cached(value: str) -> int | None:
+    """
+    Pulls the page number out of a pagination link with a direct scan; TVDb
+    links always carry a plain `page=N` pair so full query-string parsing is
+    avoidable overhead.
+    """
+    if _is_ascii_digits(value):
+        return int(value)
+    # only accept the pair at a query boundary so e.g. subpage= doesn't match
+    start = value.rfind("page=")
+    while start > 0 and value[start - 1] not in "?&":
+        start = value.rfind("page=", 0, start)
+    if start < 0:
+        return None
+    start += 5
+    end = start
+    while end < len(value) and value[end].isdigit():
+        end += 1
+    return int(value[start:end]) if end > start else None
+
+
 def _tvdb_normalize_links(links: dict | None, page: int) -> dict:
     links = links if isinstance(links, dict) else {}
     prev_page = _tvdb_extract_page(links.get("prev"))
@@ -555,32 +864,53 @@ def _tvdb_normalize_links(links: dict | None, page: int) -> dict:
     }
 
 
+_SERIES_ID_ALIASES = ("tvdb_id", "tvdbId", "id", "objectID")
+_SERIES_FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "aliases": ("aliases",),
+    "banner": ("banner",),
+    "firstAired": ("firstAired", "first_air_time"),
+    "image": ("image",),
+    "network": ("network",),
+    "overview": ("overview",),
+    "poster": ("poster",),
+    "seriesName": ("seriesName", "name"),
+    "slug": ("slug",),
+    "status": ("status",),
+}
+
+
+def _first_present(entry: dict, keys: tuple[str, ...]):
+    for key in keys:
+        value = entry.get(key)
+        if value:
+            return value
+    return None
+
+
 def _tvdb_normalize_series_entry(entry: dict | None) -> dict | None:
     if not isinstance(entry, dict):
         return None
-    series_id = _tvdb_extract_numeric_id(
-        entry.get("tvdb_id")
-        or entry.get("tvdbId")
-        or entry.get("id")
-        or entry.get("objectID")
-    )
+    series_id = _tvdb_extract_numeric_id(_first_present(entry, _SERIES_ID_ALIASES))
     if series_id in (None, ""):
         return None
-    name = entry.get("seriesName") or entry.get("name")
-    return {
-        "aliases": entry.get("aliases") or [],
-        "banner": entry.get("banner"),
-        "firstAired": entry.get("firstAired") or entry.get("first_air_time"),
-        "id": series_id,
-        "image": entry.get("image"),
-        "network": entry.get("network"),
-        "overview": entry.get("overview"),
-        "poster": entry.get("poster"),
-        "seriesId": series_id,
-        "seriesName": name,
-        "slug": entry.get("slug"),
-        "status": entry.get("status"),
+    normalized = {
+        target: _first_present(entry, keys)
+        for target, keys in _SERIES_FIELD_ALIASES.items()
     }
+    normalized["aliases"] = normalized["aliases"] or []
+    normalized["id"] = series_id
+    normalized["seriesId"] = series_id
+    return normalized
+
+
+_EPISODE_FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "airedEpisodeNumber": ("airedEpisodeNumber", "number", "episodeNumber"),
+    "airedSeason": ("airedSeason", "seasonNumber", "season"),
+    "episodeName": ("episodeName", "name"),
+    "firstAired": ("firstAired", "aired", "airedDate"),
+    "overview": ("overview",),
+    "seriesId": ("seriesId", "series_id"),
+}
 
 
 def _tvdb_normalize_episode_entry(entry: dict | None) -> dict | None:
@@ -589,21 +919,12 @@ def _tvdb_normalize_episode_entry(entry: dict | None) -> dict | None:
     episode_id = _tvdb_extract_numeric_id(entry.get("id"))
     if episode_id in (None, "", 0):
         return None
-    return {
-        "airedEpisodeNumber": entry.get("airedEpisodeNumber")
-        or entry.get("number")
-        or entry.get("episodeNumber"),
-        "airedSeason": entry.get("airedSeason")
-        or entry.get("seasonNumber")
-        or entry.get("season"),
-        "episodeName": entry.get("episodeName") or entry.get("name"),
-        "firstAired": entry.get("firstAired")
-        or entry.get("aired")
-        or entry.get("airedDate"),
-        "id": episode_id,
-        "overview": entry.get("overview"),
-        "seriesId": entry.get("seriesId") or entry.get("series_id"),
+    normalized = {
+        target: _first_present(entry, keys)
+        for target, keys in _EPISODE_FIELD_ALIASES.items()
     }
+    normalized["id"] = episode_id
+    return normalized
 
 
 def _tvdb_normalize_episode_list(data: dict | list) -> list[dict]:
@@ -619,19 +940,32 @@ def _tvdb_extract_numeric_id(value: int | str | None) -> int | str | None:
     if isinstance(value, int):
         return value
     if isinstance(value, str):
-        if value.isdigit():
+        if _is_ascii_digits(value):
             return value
-        parts = value.split("-")
-        if parts and parts[-1].isdigit():
-            return parts[-1]
+        suffix = value.rpartition("-")[2]
+        if _is_ascii_digits(suffix):
+            return suffix
     return value
 
 
+def _tvmaze_request(url: str, parameters: dict | None, cache: bool) -> tuple[int, dict]:
+    """
+    Requests TVMaze json, retrying rate-limited responses with a bounded
+    full-jitter backoff instead of unbounded recursion.
+    """
+    status, content = _bounded_request_json(url, parameters, cache=cache)
+    attempt = 1
+    while status in (429, 443) and attempt <= MAX_RETRIES:  # pragma: no cover
+        sleep(min(30.0, 2**attempt + random.random()))
+        status, content = _bounded_request_json(url, parameters, cache=cache)
+        attempt += 1
+    return status, content
+
+
 def tvmaze_show(
     id_tvmaze: str,
     embed_episodes: bool = False,
     cache: bool = False,
-    attempt: int = 1,
 ):
     """
     Retrieve all primary information for a given show.
@@ -642,18 +976,15 @@ def tvmaze_show(
     parameters = {}
     if embed_episodes:
         parameters["embed"] = "episodes"
-    status, content = request_json(url, parameters, cache=cache)
-    if status == 443 and attempt <= MAX_RETRIES:  # pragma: no cover
-        sleep(attempt * 2)
-        return tvmaze_show(id_tvmaze, embed_episodes, cache, attempt + 1)
-    elif status == 404 or not content:
+    status, content = _tvmaze_request(url, parameters, cache)
+    if status == 404 or not content:
         raise MnamerNotFoundException
     elif status != 200:  # pragma: no cover
         raise MnamerNetworkException
     return content
 
 
-def tvmaze_show_search(query: str, cache: bool = True, attempt: int = 1) -> dict:
+def tvmaze_show_search(query: str, cache: bool = True) -> dict:
     """
     Search through all the shows in the database by the show's name. A fuzzy
     algorithm is used (with a fuzziness value of 2), meaning that shows will be
@@ -664,18 +995,15 @@ def tvmaze_show_search(query: str, cache: bool = True, attempt: int = 1) -> dict
     """
     url = "http://api.tvmaze.com/search/shows"
     parameters = {"q": query}
-    status, content = request_json(url, parameters, cache=cache)
-    if status == 443 and attempt <= MAX_RETRIES:  # pragma: no cover
-        sleep(attempt * 2)
-        return tvmaze_show_search(query, cache, attempt + 1)
-    elif status == 404 or not content:
+    status, content = _tvmaze_request(url, parameters, cache)
+    if status == 404 or not content:
         raise MnamerNotFoundException
     elif status != 200:  # pragma: no cover
         raise MnamerNetworkException
     return content
 
 
-def tvmaze_show_single_search(query: str, cache: bool = True, attempt: int = 1) -> dict:
+def tvmaze_show_single_search(query: str, cache: bool = True) -> dict:
     """
     Singlesearch endpoint either returns exactly one result, or no result at
     all. This endpoint is also forgiving of typos, but less so than the regular
@@ -686,11 +1014,8 @@ def tvmaze_show_single_search(query: str, cache: bool = True, attempt: int = 1)
     """
     url = "http://api.tvmaze.com/singlesearch/shows"
     parameters = {"q": query}
-    status, content = request_json(url, parameters, cache=cache)
-    if status == 443 and attempt <= MAX_RETRIES:  # pragma: no cover
-        sleep(attempt * 2)
-        return tvmaze_show_single_search(query, cache, attempt + 1)
-    elif status == 404 or not content:
+    status, content = _tvmaze_request(url, parameters, cache)
+    if status == 404 or not content:
         raise MnamerNotFoundException
     elif status != 200:  # pragma: no cover
         raise MnamerNetworkException
@@ -701,7 +1026,6 @@ def tvmaze_show_lookup(
     id_imdb: str | None = None,
     id_tvdb: str | None = None,
     cache: bool = True,
-    attempt: int = 1,
 ) -> dict:
     """
     If you already know a show's tvrage, thetvdb or IMDB ID, you can use this
@@ -713,11 +1037,8 @@ def tvmaze_show_lookup(
         raise MnamerException("id_imdb and id_tvdb are mutually exclusive")
     url = "http://api.tvmaze.com/lookup/shows"
     parameters = {"imdb": id_imdb, "thetvdb": id_tvdb}
-    status, content = request_json(url, parameters, cache=cache)
-    if status == 443 and attempt <= MAX_RETRIES:  # pragma: no cover
-        sleep(attempt * 2)
-        return tvmaze_show_lookup(id_imdb, id_tvdb, cache, attempt + 1)
-    elif status == 404:
+    status, content = _tvmaze_request(url, parameters, cache)
+    if status == 404:
         raise MnamerNotFoundException
     elif status != 200 or not content:  # pragma: no cover
         raise MnamerNetworkException
@@ -728,7 +1049,6 @@ def tvmaze_show_episodes_list(
     id_tvmaze: str,
     include_specials: bool = False,
     cache: bool = True,
-    attempt: int = 1,
 ) -> dict:
     """
     A complete list of episodes for the given show. Episodes are returned in
@@ -739,13 +1059,8 @@ def tvmaze_show_episodes_list(
     """
     url = f"http://api.tvmaze.com/shows/{id_tvmaze}/episodes"
     parameters = {"specials": int(include_specials)}
-    status, content = request_json(url, parameters, cache=cache)
-    if status == 443 and attempt <= MAX_RETRIES:  # pragma: no cover
-        sleep(attempt * 2)
-        return tvmaze_show_episodes_list(
-            id_tvmaze, include_specials, cache, attempt + 1
-        )
-    elif status == 404:
+    status, content = _tvmaze_request(url, parameters, cache)
+    if status == 404:
         raise MnamerNotFoundException
     elif status != 200 or not content:  # pragma: no cover
         raise MnamerNetworkException
@@ -756,7 +1071,6 @@ def tvmaze_episodes_by_date(
     id_tvmaze: str,
     air_date: datetime.date | str,
     cache: bool = True,
-    attempt: int = 1,
 ) -> dict:
     """
     Retrieves all episodes from this show that have aired on a specific date.
@@ -766,11 +1080,8 @@ def tvmaze_episodes_by_date(
     """
     url = f"http://api.tvmaze.com/shows/{id_tvmaze}/episodesbydate"
     parameters = {"date": parse_date(air_date)}
-    status, content = request_json(url, parameters, cache=cache)
-    if status == 443 and attempt <= MAX_RETRIES:  # pragma: no cover
-        sleep(attempt * 2)
-        return tvmaze_episodes_by_date(id_tvmaze, air_date, cache, attempt + 1)
-    elif status == 404:
+    status, content = _tvmaze_request(url, parameters, cache)
+    if status == 404:
         raise MnamerNotFoundException
     elif status != 200 or not content:  # pragma: no cover
         raise MnamerNetworkException
@@ -782,7 +1093,6 @@ def tvmaze_episode_by_number(
     season: int | None,
     episode: int | None,
     cache: bool = True,
-    attempt: int = 1,
 ) -> dict:
     """
     Retrieve one specific episode from this show given its season number and
@@ -792,12 +1102,90 @@ def tvmaze_episode_by_number(
     """
     url = f"http://api.tvmaze.com/shows/{id_tvmaze}/episodebynumber"
     parameters = {"season": season, "number": episode}
-    status, content = request_json(url, parameters, cache=cache)
-    if status == 443 and attempt <= MAX_RETRIES:  # pragma: no cover
-        sleep(attempt * 2)
-        return tvmaze_episode_by_number(id_tvmaze, season, episode, cache, attempt + 1)
-    elif status == 404:
+    status, content = _tvmaze_request(url, parameters, cache)
+    if status == 404:
         raise MnamerNotFoundException
     elif status != 200 or not content:  # pragma: no cover
         raise MnamerNetworkException
     return content
+
+
+def run(coro):
+    """Runs a coroutine from synchronous code, returning its result."""
+    return asyncio.run(coro)
+
+
+def _make_async(endpoint):
+    """
+    Wraps a blocking endpoint as a coroutine function so that a resolver can
+    overlap lookups with asyncio.gather; each call runs in a worker thread.
+    """
+
+    @wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(endpoint, *args, **kwargs)
+
+    wrapper.__name__ += "_async"
+    wrapper.__qualname__ += "_async"
+    return wrapper
+
+
+omdb_title_async = _make_async(omdb_title)
+omdb_search_async = _make_async(omdb_search)
+tmdb_find_async = _make_async(tmdb_find)
+tmdb_movies_async = _make_async(tmdb_movies)
+tmdb_search_movies_async = _make_async(tmdb_search_movies)
+tvdb_login_async = _make_async(tvdb_login)
+tvdb_refresh_token_async = _make_async(tvdb_refresh_token)
+tvdb_episodes_id_async = _make_async(tvdb_episodes_id)
+tvdb_series_id_async = _make_async(tvdb_series_id)
+tvdb_series_id_episodes_async = _make_async(tvdb_series_id_episodes)
+tvdb_series_id_episodes_query_async = _make_async(tvdb_series_id_episodes_query)
+tvdb_search_series_async = _make_async(tvdb_search_series)
+tvmaze_show_async = _make_async(tvmaze_show)
+tvmaze_show_search_async = _make_async(tvmaze_show_search)
+tvmaze_show_single_search_async = _make_async(tvmaze_show_single_search)
+tvmaze_show_lookup_async = _make_async(tvmaze_show_lookup)
+tvmaze_show_episodes_list_async = _make_async(tvmaze_show_episodes_list)
+tvmaze_episodes_by_date_async = _make_async(tvmaze_episodes_by_date)
+tvmaze_episode_by_number_async = _make_async(tvmaze_episode_by_number)
+
+
+async def tvmaze_shows_lookup(
+    items: list[tuple[str | None, str | None]],
+    cache: bool = True,
+) -> list[dict | BaseException]:
+    """
+    Resolves many shows through tvmaze_show_lookup concurrently, overlapping
+    the one-request-per-item round-trips instead of issuing them serially.
+
+    Note: Results are returned in input order; failed lookups are returned in
+    place as exceptions rather than aborting the batch.
+    """
+    return await asyncio.gather(
+        *(
+            tvmaze_show_lookup_async(id_imdb, id_tvdb, cache=cache)
+            for id_imdb, id_tvdb in items
+        ),
+        return_exceptions=True,
+    )
+
+
+async def tvdb_series_ids(
+    token: str,
+    ids: list[str],
+    language: Language | None = None,
+    cache: bool = True,
+) -> list[dict | BaseException]:
+    """
+    Resolves many TVDb series records concurrently; the per-id counterpart of
+    tvdb_series_id with the same in-order, exceptions-in-place contract as
+    tvmaze_shows_lookup.
+    """
+    return await asyncio.gather(
+        *(
+            tvdb_series_id_async(token, id_tvdb, language=language, cache=cache)
+            for id_tvdb in ids
+        ),
+        return_exceptions=True,
+    )
@@ -12,10 +12,10 @@ from mnamer.endpoints import (
     omdb_title,
     tmdb_movies,
     tmdb_search_movies,
+    tvdb_iter_series_episodes,
     tvdb_login,
     tvdb_search_series,
     tvdb_series_id,
-    tvdb_series_id_episodes_query,
     tvmaze_episode_by_number,
     tvmaze_episodes_by_date,
     tvmaze_show,
@@ -255,38 +255,31 @@ class Tvdb(Provider):
         series_data = tvdb_series_id(
             self.token, id_tvdb, language=language, cache=self.cache
         )
-        page = 1
-        while True:
-            episode_data = tvdb_series_id_episodes_query(
-                self.token,
-                id_tvdb,
-                episode,
-                season,
-                language=language,
-                page=page,
-                cache=self.cache,
-            )
-            for entry in episode_data["data"]:
-                try:
-                    yield MetadataEpisode(
-                        date=entry["firstAired"],
-                        episode=entry["airedEpisodeNumber"],
-                        id_tvdb=id_tvdb,
-                        season=entry["airedSeason"],
-                        series=series_data["data"]["seriesName"],
-                        language=language,
-                        synopsis=(entry["overview"] or "")
-                        .replace("\r\n", "")
-                        .replace("  ", "")
-                        .strip(),
-                        title=entry["episodeName"].split(";", 1)[0],
-                    )
-                    found = True
-                except (AttributeError, KeyError, ValueError):
-                    continue
-            if page == episode_data["links"]["last"]:
-                break
-            page += 1
+        for entry in tvdb_iter_series_episodes(
+            self.token,
+            id_tvdb,
+            episode,
+            season,
+            language=language,
+            cache=self.cache,
+        ):
+            try:
+                yield MetadataEpisode(
+                    date=entry["firstAired"],
+                    episode=entry["airedEpisodeNumber"],
+                    id_tvdb=id_tvdb,
+                    season=entry["airedSeason"],
+                    series=series_data["data"]["seriesName"],
+                    language=language,
+                    synopsis=(entry["overview"] or "")
+                    .replace("\r\n", "")
+                    .replace("  ", "")
+                    .strip(),
+                    title=entry["episodeName"].split(";", 1)[0],
+                )
+                found = True
+            except (AttributeError, KeyError, ValueError):
+                continue
         if not found:
             raise MnamerNotFoundException
 
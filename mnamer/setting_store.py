@@ -368,7 +368,7 @@ class SettingStore:
         default=False,
         metadata=SettingSpec(group=SettingType.CONFIGURATION).as_dict(),
     )
-    watch_input_directory: Path | None = dataclasses.field(
+    watch_input_directory: Path | list[Path] | None = dataclasses.field(
         default=None,
         metadata=SettingSpec(group=SettingType.CONFIGURATION).as_dict(),
     )
@@ -384,6 +384,14 @@ class SettingStore:
         default=5,
         metadata=SettingSpec(group=SettingType.CONFIGURATION).as_dict(),
     )
+    watch_concurrency: int = dataclasses.field(
+        default=1,
+        metadata=SettingSpec(group=SettingType.CONFIGURATION).as_dict(),
+    )
+    watch_low_priority: bool = dataclasses.field(
+        default=True,
+        metadata=SettingSpec(group=SettingType.CONFIGURATION).as_dict(),
+    )
     cleanup_empty_source_dirs: bool = dataclasses.field(
         default=False,
         metadata=SettingSpec(group=SettingType.CONFIGURATION).as_dict(),
@@ -405,6 +413,14 @@ class SettingStore:
     def _resolve_path(path: str | Path) -> Path:
         return Path(path).resolve()
 
+    @classmethod
+    def _resolve_paths(
+        cls, value: str | Path | list[str | Path]
+    ) -> Path | list[Path]:
+        if isinstance(value, (list, tuple, set)):
+            return [cls._resolve_path(path) for path in value]
+        return cls._resolve_path(value)
+
     def __setattr__(self, key: str, value: Any):
         converter_map: dict[str, Callable] = {
             "episode_api": ProviderType,
@@ -415,7 +431,7 @@ class SettingStore:
             "movie_api": ProviderType,
             "movie_directory": self._resolve_path,
             "targets": lambda targets: [Path(target) for target in targets],
-            "watch_input_directory": self._resolve_path,
+            "watch_input_directory": self._resolve_paths,
         }
         converter: Callable | None = converter_map.get(key)
         if value is not None and converter:
@@ -1,11 +1,23 @@
 """A collection of utility functions non-specific to mnamer's domain logic."""
 
+import atexit
 import datetime as dt
 import json
 import re
+import threading
+import time
 from collections.abc import Callable, Iterator
 from os import walk
-from os.path import exists, expanduser, expandvars, getsize, splitdrive, splitext
+from os.path import (
+    abspath,
+    exists,
+    expanduser,
+    expandvars,
+    getsize,
+    join,
+    splitdrive,
+    splitext,
+)
 from pathlib import Path, PurePath
 from typing import Any
 from unicodedata import normalize
@@ -15,6 +27,11 @@ from requests.adapters import HTTPAdapter
 
 from mnamer.const import CACHE_PATH, CURRENT_YEAR, SUBTITLE_CONTAINERS
 
+try:  # orjson's C scanner parses large payloads several times faster
+    from orjson import loads as _json_loads  # type: ignore
+except ModuleNotFoundError:
+    from json import loads as _json_loads
+
 
 def clean_dict(target_dict: dict, whitelist=None) -> dict:
     """Convenience function that removes a dicts keys that have falsy values."""
@@ -28,23 +45,35 @@ def clean_dict(target_dict: dict, whitelist=None) -> dict:
 def clear_cache():
     """Clears requests-cache cache."""
     get_session().cache.clear()
+    clear_swr_cache()
+
+
+def clear_swr_cache():
+    """Clears the in-process stale-while-revalidate response cache."""
+    with _swr_lock:
+        _swr_cache.clear()
+        _swr_refreshing.clear()
+        for counter in _swr_counters:
+            _swr_counters[counter] = 0
 
 
 def crawl_in(file_paths: list[Path], recurse: bool = False) -> list[Path]:
     """Looks for files amongst or within paths provided."""
-    found_files = set()
+    found_files: set[str] = set()
     for file_path in file_paths:
         if not file_path.exists():
             continue
         if file_path.is_file():
-            found_files.add(Path(file_path).absolute())
+            found_files.add(abspath(file_path))
             continue
-        for root, _dirs, files in walk(file_path):
+        # walking from an absolute root keeps every joined path absolute so
+        # files don't each pay their own normalization pass
+        for root, _dirs, files in walk(abspath(file_path)):
             for file in files:
-                found_files.add(Path(root, file).absolute())
+                found_files.add(join(root, file))
             if not recurse:
                 break
-    return sorted(found_files)
+    return sorted(Path(found) for found in found_files)
 
 
 def crawl_out(filename: str | Path | PurePath) -> Path | None:
@@ -71,15 +100,13 @@ def filename_replace(filename: str, replacements: dict[str, str]) -> str:
 
 def filter_blacklist(paths: list[Path], blacklist: list[str]) -> list[Path]:
     """Filters (set difference) paths by a collection of regex patterns."""
-    return [
-        path.absolute()
-        for path in paths
-        if not any(
-            re.search(pattern, str(path), re.IGNORECASE)
-            for pattern in blacklist
-            if pattern
-        )
-    ]
+    patterns = [pattern for pattern in blacklist if pattern]
+    if not patterns:
+        return [path.absolute() for path in paths]
+    # one combined alternation compiled once beats re-scanning each path with
+    # every pattern through the module cache
+    regex = re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    return [path.absolute() for path in paths if not regex.search(str(path))]
 
 
 def filter_containers(
@@ -152,9 +179,14 @@ def get_session() -> requests_cache.CachedSession:
             extension=".sqlite",
             expire_after=518_400,  # 6 days
         )
-        adapter = HTTPAdapter(max_retries=3)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=3,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
+        atexit.register(session.close)
         return session
 
     if hasattr(get_session, "session"):
@@ -223,18 +255,83 @@ def parse_date(value: str | dt.date | dt.datetime) -> dt.date:
     return value
 
 
+# Soft TTL: responses younger than this are served without revalidation.
+# Hard TTL: responses older than the soft TTL but younger than this are served
+# stale while a background thread refreshes them; anything older is refetched.
+_SWR_SOFT_TTL = 3_600  # 1 hour
+_SWR_HARD_TTL = 604_800  # 7 days
+
+_swr_cache: dict[tuple, tuple[float, int, dict]] = {}
+_swr_refreshing: set[tuple] = set()
+_swr_lock = threading.Lock()
+_swr_counters = {"hit": 0, "stale_hit": 0, "miss": 0}
+
+
+def _swr_lookup(key: tuple, fetch: Callable) -> tuple[int, dict] | None:
+    """Returns a cached response for key, refreshing stale entries off-thread."""
+    with _swr_lock:
+        entry = _swr_cache.get(key)
+    if entry is None:
+        _swr_counters["miss"] += 1
+        return None
+    timestamp, status, content = entry
+    age = time.monotonic() - timestamp
+    if age >= _SWR_HARD_TTL:
+        with _swr_lock:
+            _swr_cache.pop(key, None)
+        _swr_counters["miss"] += 1
+        return None
+    if age >= _SWR_SOFT_TTL:
+        _swr_counters["stale_hit"] += 1
+        _swr_refresh(key, fetch)
+    else:
+        _swr_counters["hit"] += 1
+    return status, content
+
+
+def _swr_refresh(key: tuple, fetch: Callable):
+    """Kicks off a daemon thread to refresh a stale cache entry."""
+    with _swr_lock:
+        if key in _swr_refreshing:
+            return
+        _swr_refreshing.add(key)
+
+    def refresh():
+        try:
+            status, content = fetch()
+            if status // 100 == 2 and content:
+                _swr_store(key, status, content)
+        except Exception:
+            pass  # stale entry remains usable until the hard TTL lapses
+        finally:
+            with _swr_lock:
+                _swr_refreshing.discard(key)
+
+    threading.Thread(target=refresh, daemon=True).start()
+
+
+def _swr_store(key: tuple, status: int, content: dict):
+    with _swr_lock:
+        _swr_cache[key] = (time.monotonic(), status, content)
+
+
 def request_json(
     url,
     parameters: dict | list | None = None,
     body: dict | None = None,
     headers: dict | None = None,
     cache: bool = True,
+    pace: Callable[[], None] | None = None,
 ) -> tuple[int, dict]:
     """
     Queries a url for json data.
 
     Note: Requests are cached using requests_cached for a week, this is done
-    transparently by using the package's monkey patching.
+    transparently by using the package's monkey patching. Successful GET
+    responses are additionally kept in a small in-process cache and served
+    stale-while-revalidate to keep repeat lookups off the network entirely.
+    The optional pace callable runs only when a fetch is actually issued so
+    rate limiting never charges for in-process cache hits.
     """
     assert url
     session = get_session()
@@ -256,24 +353,37 @@ def request_json(
         "like Gecko) Chrome/79.0.3945.88 Safari/537.36"
     )
 
-    initial_cache_state = session._disabled  # yes, i'm a bad person
-    try:
-        session._disabled = not cache
-        response = session.request(
-            url=url,
-            params=parameters,
-            json=body,
-            headers=headers,
-            method=method,
-            timeout=1,
-        )
-        status = response.status_code
-        content = response.json() if status // 100 == 2 else None
-    except Exception:
-        content = None
-        status = 500
-    finally:
-        session._disabled = initial_cache_state
+    def fetch() -> tuple[int, dict | None]:
+        if pace is not None:
+            pace()
+        try:
+            response = session.request(
+                url=url,
+                params=parameters,
+                json=body,
+                headers=headers,
+                method=method,
+                timeout=1,
+                # per-request expiration is thread-safe, unlike toggling the
+                # session-wide disabled flag from concurrent workers
+                expire_after=None if cache else requests_cache.DO_NOT_CACHE,
+            )
+            status = response.status_code
+            content = _json_loads(response.content) if status // 100 == 2 else None
+        except Exception:
+            content = None
+            status = 500
+        return status, content
+
+    swr_key = None
+    if cache and method == "GET":
+        swr_key = (url, tuple(parameters or ()), tuple(sorted(headers.items())))
+        cached = _swr_lookup(swr_key, fetch)
+        if cached is not None:
+            return cached
+    status, content = fetch()
+    if swr_key is not None and status // 100 == 2 and content:
+        _swr_store(swr_key, status, content)
     return status, (content or {})
 
 
@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+import contextlib
+import ctypes
+import errno
+import heapq
+import os
+import re
+import selectors
+import struct
+import sys
+import threading
 import time
-from dataclasses import dataclass
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import rmtree
 from typing import Callable
@@ -10,13 +22,126 @@ from mnamer import tty
 from mnamer.setting_store import SettingStore
 from mnamer.target import Target
 from mnamer.types import MessageType
-from mnamer.utils import crawl_in, filter_blacklist, filter_containers
+from mnamer.utils import normalize_containers
 
+# long-lived watch sessions must not grow state without bound; oldest
+# entries are evicted LRU-style once these caps are reached
+_ATTEMPTED_MAX = 100_000
+_PROCESSED_DIRS_MAX = 10_000
+_TRASH_PREFIX = ".mnamer-trash-"
 
-@dataclass(frozen=True)
-class FileState:
-    size: int
-    mtime_ns: int
+try:  # kernel event notification; falls back to pure polling when absent
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ModuleNotFoundError:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _WatchEventHandler(FileSystemEventHandler):
+    """Funnels filesystem events into the watcher's queue and wakes its loop."""
+
+    def __init__(self, watcher: Watcher):
+        self._watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        if getattr(event, "is_directory", False):
+            return
+        with self._watcher._events_lock:
+            self._watcher._events.append(event.src_path)
+        self._watcher._wake.set()
+
+    def on_closed(self, event) -> None:
+        if getattr(event, "is_directory", False):
+            return
+        with self._watcher._events_lock:
+            self._watcher._close_seen[event.src_path] = self._watcher._tick
+
+
+class _InotifyReader:
+    """
+    Minimal ctypes-based inotify reader used on Linux when watchdog isn't
+    installed; feeds created/renamed/closed paths into the watcher's event
+    queue through a selectors-driven daemon thread.
+    """
+
+    IN_CREATE = 0x00000100
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_ISDIR = 0x40000000
+    _EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, watcher: Watcher):
+        self._watcher = watcher
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._fd, selectors.EVENT_READ)
+        self._watches: dict[int, str] = {}
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        for watch_root in self._watcher._watch_root_strs:
+            self._add_watch(watch_root)
+            if self._watcher._recursive:
+                for root, dirs, _files in os.walk(watch_root):
+                    for name in dirs:
+                        self._add_watch(os.path.join(root, name))
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def join(self) -> None:
+        if self._thread:
+            self._thread.join()
+        self._selector.close()
+        os.close(self._fd)
+
+    def _add_watch(self, directory: str) -> None:
+        mask = self.IN_CREATE | self.IN_CLOSE_WRITE | self.IN_MOVED_TO
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), mask)
+        if wd >= 0:
+            self._watches[wd] = directory
+
+    def _loop(self) -> None:
+        while not self._stopped.is_set():
+            if self._selector.select(timeout=0.5):
+                self._drain()
+
+    def _drain(self) -> None:
+        try:
+            data = os.read(self._fd, 65536)
+        except (OSError, BlockingIOError):
+            return
+        offset = 0
+        woke = False
+        while offset + self._EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & self.IN_ISDIR:
+                if self._watcher._recursive and mask & (
+                    self.IN_CREATE | self.IN_MOVED_TO
+                ):
+                    self._add_watch(path)
+                continue
+            with self._watcher._events_lock:
+                self._watcher._events.append(path)
+                if mask & self.IN_CLOSE_WRITE:
+                    self._watcher._close_seen[path] = self._watcher._tick
+            woke = True
+        if woke:
+            self._watcher._wake.set()
 
 
 class Watcher:
@@ -29,106 +154,379 @@ class Watcher:
     ):
         self.settings = settings
         self.process_target = process_target
-        self.watch_directory = settings.watch_input_directory
-        if not self.watch_directory:
+        configured = settings.watch_input_directory
+        if not configured:
             raise RuntimeError("watch_input_directory must be configured for watch mode")
+        # accept one root or many; a single watcher serves them all rather
+        # than spawning a poller/observer per directory
+        if isinstance(configured, (list, tuple, set)):
+            self.watch_directories = tuple(Path(root) for root in configured)
+        else:
+            self.watch_directories = (Path(configured),)
+        self.watch_directory = self.watch_directories[0]
         self.poll_interval = max(1, int(settings.watch_poll_interval))
         self.settle_seconds = max(0, int(settings.watch_settle_seconds))
+        self.concurrency = max(1, int(settings.watch_concurrency))
         self.cleanup_empty_source_dirs = bool(settings.cleanup_empty_source_dirs)
         self.cleanup_processed_source_dirs = bool(
             settings.cleanup_empty_source_dirs and settings.cleanup_processed_source_dirs
         )
-        self._pending: dict[Path, tuple[FileState, float]] = {}
-        self._attempted: dict[Path, FileState] = {}
-        self._processed_dirs: set[Path] = set()
+        self._watch_roots_resolved = frozenset(
+            root.resolve() for root in self.watch_directories
+        )
+        self._watch_root_strs = tuple(
+            os.fspath(root.absolute()) for root in self.watch_directories
+        )
+        self._recursive = bool(settings.watch_recursive)
+        self._mask_suffixes = tuple(normalize_containers(settings.mask or []))
+        patterns = [pattern for pattern in settings.ignore if pattern]
+        self._ignore_regex = (
+            re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+            if patterns
+            else None
+        )
+        self._resolved_cache: dict[Path, Path] = {}
+        # hot-path maps are keyed by path strings: str hashing is several
+        # times cheaper than Path hashing and the keys are mostly interned
+        self._pending: dict[str, tuple[tuple[int, int], float]] = {}
+        self._deadlines: list[tuple[float, str]] = []
+        # generation counter instead of a fresh seen-paths set per tick: the
+        # persistent dict is updated in place and pruned by comparing stamps
+        self._tick = 0
+        self._seen_generation: dict[str, int] = {}
+        self._attempted: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        self._processed_dirs: OrderedDict[Path, None] = OrderedDict()
+        self._masked_counts: dict[str, int] = {}
+        self._events: deque[str] = deque()
+        # paths whose writer closed them for writing, stamped with the tick
+        # they were observed on so stale entries can be pruned; a close-write
+        # event is a strong enough done signal to skip the timed settle wait
+        self._close_seen: dict[str, int] = {}
+        self._events_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker_pool = (
+            ThreadPoolExecutor(max_workers=self.concurrency)
+            if self.concurrency > 1
+            else None
+        )
+        self._trash_pool = ThreadPoolExecutor(max_workers=1)
 
     def run(self) -> None:
         tty.msg(
-            f"watching '{self.watch_directory}' (poll={self.poll_interval}s settle={self.settle_seconds}s)",
+            "watching '"
+            + "', '".join(str(root) for root in self.watch_directories)
+            + f"' (poll={self.poll_interval}s settle={self.settle_seconds}s)",
             MessageType.ALERT,
         )
-        while True:
-            self.run_once()
-            time.sleep(self.poll_interval)
+        if self.settings.watch_low_priority and hasattr(os, "nice"):
+            # yield the CPU to foreground work; the watch loop is I/O-bound
+            # and loses nothing by running at the lowest priority
+            with contextlib.suppress(OSError, PermissionError):
+                os.nice(19)
+        observer = self._start_observer()
+        try:
+            while True:
+                self.run_once()
+                wait = self._next_wait()
+                if observer:
+                    # sleep until a filesystem event arrives or, failing that,
+                    # the next settle deadline or poll interval lapses
+                    self._wake.wait(timeout=wait)
+                    self._wake.clear()
+                    with self._events_lock:
+                        self._events.clear()
+                else:
+                    time.sleep(wait)
+        finally:
+            if observer:
+                observer.stop()
+                observer.join()
+
+    def _next_wait(self) -> float:
+        """
+        Returns how long the loop may sleep: until the earliest pending settle
+        deadline when one is queued sooner than the poll interval, so settled
+        files are picked up as they come due instead of a full tick later.
+        """
+        if self._deadlines:
+            delay = self._deadlines[0][0] - time.monotonic()
+            if delay <= 0:
+                return 0.0
+            return min(float(self.poll_interval), delay)
+        return float(self.poll_interval)
+
+    def _start_observer(self):
+        """
+        Starts a kernel event source: watchdog's Observer when installed, a
+        direct inotify reader on Linux otherwise, or None to poll.
+        """
+        if Observer is not None:
+            try:
+                observer = Observer()
+                handler = _WatchEventHandler(self)
+                for watch_root in self.watch_directories:
+                    observer.schedule(
+                        handler, str(watch_root), recursive=self._recursive
+                    )
+                observer.daemon = True
+                observer.start()
+                return observer
+            except OSError:
+                pass
+        if sys.platform.startswith("linux"):
+            try:
+                reader = _InotifyReader(self)
+                reader.start()
+                return reader
+            except (OSError, AttributeError):
+                return None
+        return None
 
     def run_once(self) -> int:
         """One polling cycle. Returns number of files processed."""
         now = time.monotonic()
-        processed = 0
-        seen_paths = set()
-        for file_path in self._iter_files():
-            seen_paths.add(file_path)
-            try:
-                stat = file_path.stat()
-            except OSError:
+        self._tick += 1
+        tick = self._tick
+        seen_generation = self._seen_generation
+        close_seen = self._close_seen
+        current: dict[str, tuple[int, int]] = {}
+        masked_counts: dict[str, int] = {}
+        for key, size, mtime_ns in self._iter_files():
+            seen_generation[key] = tick
+            parent = os.path.dirname(key)
+            masked_counts[parent] = masked_counts.get(parent, 0) + 1
+            state = (size, mtime_ns)
+            if self._attempted.get(key) == state:
                 continue
-            state = FileState(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
-            if self._attempted.get(file_path) == state:
+            previous = self._pending.get(key)
+            if not previous or previous[0] != state:
+                self._pending[key] = (state, now)
+                # a close-write event means the writer is done; settle
+                # immediately instead of waiting out the timed window
+                deadline = (
+                    now if key in close_seen else now + self.settle_seconds
+                )
+                heapq.heappush(self._deadlines, (deadline, key))
+            current[key] = state
+
+        # a close-write observed after a file was already queued never reaches
+        # the scan branch above; promote those pending entries to fire now
+        if close_seen:
+            with self._events_lock:
+                promotable = [key for key in close_seen if key in self._pending]
+            for key in promotable:
+                heapq.heappush(self._deadlines, (now, key))
+
+        # pop only deadlines that have come due; entries invalidated by later
+        # writes or processing are skipped lazily rather than removed eagerly
+        ready: list[tuple[str, tuple[int, int]]] = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _deadline, key = heapq.heappop(self._deadlines)
+            pending = self._pending.get(key)
+            if not pending:
                 continue
-            previous = self._pending.get(file_path)
-            if previous and previous[0] == state:
-                first_seen = previous[1]
-            else:
-                first_seen = now
-                self._pending[file_path] = (state, first_seen)
-            if now - first_seen < self.settle_seconds:
+            state, first_seen = pending
+            if current.get(key) != state:
                 continue
-            target = Target(file_path, self.settings)
-            self.process_target(target)
-            if not file_path.exists():
-                self._processed_dirs.add(file_path.parent)
-            self._attempted[file_path] = state
-            self._pending.pop(file_path, None)
-            processed += 1
+            if first_seen + self.settle_seconds > now and key not in close_seen:
+                continue  # rescheduled since this deadline was queued
+            self._pending.pop(key, None)
+            ready.append((key, state))
+        self._masked_counts = masked_counts
+        processed = self._process_ready(ready)
 
-        self._prune_missing(seen_paths)
+        self._prune_missing()
         self._cleanup_processed_directories()
         return processed
 
-    def _iter_files(self) -> list[Path]:
-        file_paths = crawl_in([self.watch_directory], recurse=self.settings.watch_recursive)
-        file_paths = filter_blacklist(file_paths, self.settings.ignore)
-        file_paths = filter_containers(file_paths, self.settings.mask)
-        return file_paths
+    def _process_ready(self, ready: list[tuple[str, tuple[int, int]]]) -> int:
+        """
+        Processes settled targets, fanning out across the worker pool when
+        watch_concurrency is greater than one; the lookups and moves are
+        I/O-bound so overlapping them shortens batch wall time.
+        """
+        paths = [Path(key) for key, _state in ready]
+        if self._worker_pool and len(ready) > 1:
+            futures = [
+                self._worker_pool.submit(
+                    self.process_target, Target(file_path, self.settings)
+                )
+                for file_path in paths
+            ]
+            for future in futures:
+                future.result()
+        else:
+            for file_path in paths:
+                self.process_target(Target(file_path, self.settings))
+        for file_path, (key, state) in zip(paths, ready, strict=True):
+            if not file_path.exists():
+                parent = file_path.parent
+                self._processed_dirs[parent] = None
+                self._processed_dirs.move_to_end(parent)
+                if len(self._processed_dirs) > _PROCESSED_DIRS_MAX:
+                    self._processed_dirs.popitem(last=False)
+                parent_key = os.path.dirname(key)
+                remaining = self._masked_counts.get(parent_key, 0)
+                if remaining:
+                    self._masked_counts[parent_key] = remaining - 1
+            self._attempted[key] = state
+            self._attempted.move_to_end(key)
+            if len(self._attempted) > _ATTEMPTED_MAX:
+                self._attempted.popitem(last=False)
+            self._close_seen.pop(key, None)
+        return len(ready)
+
+    def _iter_files(self) -> list[tuple[str, int, int]]:
+        """
+        Walks the watch tree with os.scandir, harvesting each file's size and
+        mtime from the directory enumeration itself so the poll loop never has
+        to stat files a second time. Paths stay raw strings until a consumer
+        actually needs a Path.
+        """
+        entries: list[tuple[str, int, int]] = []
+        for watch_root in self._watch_root_strs:
+            self._scan_directory(watch_root, entries, self._recursive)
+        entries.sort()
+        return entries
+
+    def _scan_directory(
+        self,
+        directory: str,
+        entries: list[tuple[str, int, int]],
+        recurse: bool,
+    ) -> None:
+        """
+        Recurses with os.scandir, applying the blacklist and container mask
+        inline: blacklisted directories are never descended and non-matching
+        files never produce Path objects or stat calls.
+        """
+        ignore_regex = self._ignore_regex
+        mask_suffixes = self._mask_suffixes
+        try:
+            scanner = os.scandir(directory)
+        except OSError:
+            return
+        with scanner:
+            for entry in scanner:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.startswith(_TRASH_PREFIX):
+                            continue  # awaiting background deletion
+                        if recurse and not (
+                            ignore_regex and ignore_regex.search(entry.path)
+                        ):
+                            self._scan_directory(entry.path, entries, recurse)
+                    elif entry.is_file():
+                        if ignore_regex and ignore_regex.search(entry.path):
+                            continue
+                        if mask_suffixes and not entry.name.lower().endswith(
+                            mask_suffixes
+                        ):
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                        entries.append(
+                            (entry.path, stat.st_size, stat.st_mtime_ns)
+                        )
+                except OSError:
+                    continue
 
-    def _prune_missing(self, seen_paths: set[Path]) -> None:
-        for file_path in tuple(self._pending):
-            if file_path not in seen_paths:
-                del self._pending[file_path]
-        for file_path in tuple(self._attempted):
-            if file_path not in seen_paths:
-                del self._attempted[file_path]
+    def _prune_missing(self) -> None:
+        tick = self._tick
+        seen_generation = self._seen_generation
+        for key in tuple(self._pending):
+            if seen_generation.get(key) != tick:
+                del self._pending[key]
+        for key in tuple(self._attempted):
+            if seen_generation.get(key) != tick:
+                del self._attempted[key]
+        for key in tuple(seen_generation):
+            if seen_generation[key] != tick:
+                del seen_generation[key]
+        if self._close_seen:
+            # drop close events for paths the scan no longer sees (masked-out,
+            # blacklisted, or deleted files would otherwise leak forever);
+            # entries stamped this tick get one scan to show up first
+            with self._events_lock:
+                stale = [
+                    key
+                    for key, close_tick in self._close_seen.items()
+                    if close_tick < tick and seen_generation.get(key) != tick
+                ]
+                for key in stale:
+                    del self._close_seen[key]
 
     def _cleanup_processed_directories(self) -> None:
         if not self.cleanup_empty_source_dirs and not self.cleanup_processed_source_dirs:
             return
-        watch_root = self.watch_directory.resolve()
+        watch_roots = self._watch_roots_resolved
+        blocked = self._dirs_with_masked_files()
         for directory in tuple(self._processed_dirs):
             if not directory.exists():
-                self._processed_dirs.discard(directory)
+                self._discard_processed_dir(directory)
                 continue
-            if directory.resolve() == watch_root:
+            resolved = self._resolved_cache.get(directory)
+            if resolved is None:
+                # setdefault would resolve eagerly on every pass; only pay
+                # the syscalls on the first miss
+                resolved = self._resolved_cache[directory] = directory.resolve()
+            if resolved in watch_roots:
                 continue
-            if self._has_masked_files(directory):
+            if os.fspath(directory) in blocked:
                 continue
             try:
                 if self.cleanup_processed_source_dirs:
-                    rmtree(directory)
-                    tty.msg(
-                        f"deleted processed source directory '{directory}'",
-                        MessageType.ALERT,
+                    # rename is a single metadata op; the per-file unlinking
+                    # happens off-thread so the poll loop isn't blocked on
+                    # directories with thousands of entries
+                    trash = directory.with_name(
+                        f"{_TRASH_PREFIX}{uuid.uuid4().hex}"
                     )
-                elif self.cleanup_empty_source_dirs and not any(directory.iterdir()):
-                    directory.rmdir()
+                    directory.rename(trash)
+                    self._trash_pool.submit(rmtree, trash, ignore_errors=True)
                     tty.msg(
-                        f"deleted empty source directory '{directory}'",
+                        f"deleted processed source directory '{directory}'",
                         MessageType.ALERT,
                     )
+                elif self.cleanup_empty_source_dirs:
+                    # rmdir reports non-emptiness itself; probing with a
+                    # directory scan first would just duplicate the work
+                    try:
+                        os.rmdir(directory)
+                    except OSError as error:
+                        if error.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                            raise
+                    else:
+                        tty.msg(
+                            f"deleted empty source directory '{directory}'",
+                            MessageType.ALERT,
+                        )
             except OSError:
                 continue
-            self._processed_dirs.discard(directory)
+            self._discard_processed_dir(directory)
 
-    def _has_masked_files(self, directory: Path) -> bool:
-        file_paths = crawl_in([directory], recurse=True)
-        file_paths = filter_containers(file_paths, self.settings.mask)
-        return any(file_paths)
+    def _discard_processed_dir(self, directory: Path) -> None:
+        self._processed_dirs.pop(directory, None)
+        self._resolved_cache.pop(directory, None)
+
+    def _dirs_with_masked_files(self) -> set[str]:
+        """
+        Answers from the counters maintained during the scan rather than
+        re-walking candidate directories on every cleanup pass. Each directory
+        holding unprocessed media is expanded to its ancestors once, so the
+        per-candidate check is a set lookup with zero syscalls.
+        """
+        watch_roots = set(self._watch_root_strs)
+        blocked: set[str] = set()
+        for masked_dir, count in self._masked_counts.items():
+            if not count:
+                continue
+            current = masked_dir
+            while current not in blocked:
+                blocked.add(current)
+                if current in watch_roots:
+                    break
+                parent = os.path.dirname(current)
+                if parent == current:
+                    break
+                current = parent
+        return blocked
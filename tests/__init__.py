@@ -39,6 +39,8 @@ DEFAULT_SETTINGS = {
     "watch": False,
     "watch_enabled": False,
     "watch_input_directory": None,
+    "watch_concurrency": 1,
+    "watch_low_priority": True,
     "watch_poll_interval": 5,
     "watch_recursive": False,
     "watch_settle_seconds": 20,
@@ -5,6 +5,15 @@ from shutil import rmtree
 
 import pytest
 
+from mnamer.utils import clear_swr_cache
+
+
+@pytest.fixture(autouse=True)
+def isolate_swr_cache():
+    clear_swr_cache()
+    yield
+    clear_swr_cache()
+
 
 @pytest.fixture
 def setup_test_dir(request):
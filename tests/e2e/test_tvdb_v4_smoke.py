@@ -52,7 +52,7 @@ def test_tvdb_smoke_parse_search_lookup_and_format(e2e_run, setup_test_files, mo
     monkeypatch.setattr("mnamer.providers.tvdb_search_series", fake_tvdb_search_series)
     monkeypatch.setattr("mnamer.providers.tvdb_series_id", fake_tvdb_series_id)
     monkeypatch.setattr(
-        "mnamer.providers.tvdb_series_id_episodes_query",
+        "mnamer.endpoints.tvdb_series_id_episodes_query",
         fake_tvdb_series_id_episodes_query,
     )
 
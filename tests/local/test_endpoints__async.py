@@ -0,0 +1,89 @@
+import pytest
+
+from mnamer.endpoints import (
+    run,
+    tvmaze_show_async,
+    tvmaze_show_episodes_list_async,
+    tvmaze_shows_lookup,
+)
+from mnamer.exceptions import MnamerNotFoundException
+
+pytestmark = pytest.mark.local
+
+
+def test_async_wrapper__returns_endpoint_result(monkeypatch):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        return 200, {"id": 1, "name": "Series Alpha"}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    result = run(tvmaze_show_async("1"))
+    assert result["name"] == "Series Alpha"
+
+
+def test_async_wrapper__propagates_exceptions(monkeypatch):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        return 404, {}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    with pytest.raises(MnamerNotFoundException):
+        run(tvmaze_show_async("1"))
+
+
+def test_async_wrapper__gathers_concurrent_lookups(monkeypatch):
+    import asyncio
+
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        if url.endswith("/episodes"):
+            return 200, {"episodes": []}
+        return 200, {"id": int(url.rsplit("/", 1)[-1])}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    async def resolve():
+        return await asyncio.gather(
+            tvmaze_show_async("1"),
+            tvmaze_show_async("2"),
+            tvmaze_show_episodes_list_async("1"),
+        )
+
+    show_a, show_b, episodes = run(resolve())
+    assert show_a["id"] == 1
+    assert show_b["id"] == 2
+    assert episodes == {"episodes": []}
+
+
+def test_tvmaze_shows_lookup__batches_in_order(monkeypatch):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        lookup = dict(parameters or {})
+        return 200, {"id": lookup.get("imdb") or lookup.get("thetvdb")}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    results = run(tvmaze_shows_lookup([("tt0111161", None), (None, "73739")]))
+    assert [result["id"] for result in results] == ["tt0111161", "73739"]
+
+
+def test_tvmaze_shows_lookup__keeps_failures_in_place(monkeypatch):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        lookup = dict(parameters or {})
+        if lookup.get("imdb") == "tt0000000":
+            return 404, {}
+        return 200, {"id": lookup.get("imdb")}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    results = run(tvmaze_shows_lookup([("tt0111161", None), ("tt0000000", None)]))
+    assert results[0]["id"] == "tt0111161"
+    assert isinstance(results[1], MnamerNotFoundException)
@@ -0,0 +1,85 @@
+import pytest
+
+from mnamer.endpoints import _bounded_request_json, _HostLimiter
+
+pytestmark = pytest.mark.local
+
+
+def test_host_limiter__burst_within_capacity_does_not_block(monkeypatch):
+    limiter = _HostLimiter(rate=5, per=1)
+    monkeypatch.setattr(
+        "mnamer.endpoints.sleep",
+        lambda seconds: (_ for _ in ()).throw(AssertionError("slept")),
+    )
+    for _ in range(5):
+        limiter.acquire()
+    assert limiter.tokens < 1.0
+
+
+def test_host_limiter__refills_over_time():
+    limiter = _HostLimiter(rate=10, per=1)
+    limiter.tokens = 0.0
+    limiter.updated -= 1  # simulate one elapsed second
+    limiter.acquire()
+    assert limiter.tokens >= 0.0
+
+
+def test_bounded_request_json__paces_known_hosts(monkeypatch):
+    acquired = []
+
+    class MockLimiter:
+        def acquire(self):
+            acquired.append(True)
+
+    monkeypatch.setattr("mnamer.endpoints._LIMITERS", {"api.tvmaze.com": MockLimiter()})
+
+    def mock_request_json(*args, pace=None, **kwargs):
+        if pace is not None:
+            pace()  # request_json paces only when a fetch actually happens
+        return 200, {}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    _bounded_request_json("http://api.tvmaze.com/shows/1")
+    assert acquired == [True]
+
+    _bounded_request_json("http://www.omdbapi.com")
+    assert acquired == [True]  # unknown hosts pass through unthrottled
+
+
+def test_bounded_request_json__single_flights_identical_requests(monkeypatch):
+    import threading
+
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        calls.append(url)
+        started.set()
+        release.wait(timeout=5)
+        return 200, {"id": 1}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", slow_request_json)
+    monkeypatch.setattr("mnamer.endpoints._LIMITERS", {})
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                _bounded_request_json("http://api.tvmaze.com/shows/1", {"a": 1})
+            )
+        )
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    assert started.wait(timeout=5), "leader request never started"
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert results == [(200, {"id": 1})] * 3
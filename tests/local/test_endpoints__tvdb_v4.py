@@ -1,10 +1,22 @@
-from mnamer.endpoints import tvdb_login, tvdb_search_series, tvdb_series_id
+import pytest
+
+from mnamer.endpoints import (
+    _tvdb_extract_page,
+    _tvdb_request_first_available,
+    tvdb_iter_series_episodes,
+    tvdb_login,
+    tvdb_search_series,
+    tvdb_series_id,
+)
+from mnamer.exceptions import MnamerException, MnamerNotFoundException
 
 
 def test_tvdb_login__extracts_v4_data_token(monkeypatch):
     calls = []
 
-    def mock_request_json(url, parameters=None, body=None, headers=None, cache=True):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
         calls.append(
             {
                 "url": url,
@@ -18,7 +30,7 @@ def test_tvdb_login__extracts_v4_data_token(monkeypatch):
 
     monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
 
-    token = tvdb_login("api-key")
+    token = tvdb_login("api-key", cache=False)
 
     assert token == "jwt-token"
     assert calls[0]["url"].endswith("/v4/login")
@@ -29,7 +41,9 @@ def test_tvdb_login__extracts_v4_data_token(monkeypatch):
 def test_tvdb_search_series__uses_bearer_and_normalizes(monkeypatch):
     observed_headers = {}
 
-    def mock_request_json(url, parameters=None, body=None, headers=None, cache=True):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
         observed_headers.update(headers or {})
         assert url.endswith("/v4/search")
         assert parameters["q"] == "Series Alpha"
@@ -50,7 +64,9 @@ def test_tvdb_search_series__uses_bearer_and_normalizes(monkeypatch):
 
 
 def test_tvdb_search_series__normalizes_series_prefixed_ids(monkeypatch):
-    def mock_request_json(url, parameters=None, body=None, headers=None, cache=True):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
         assert url.endswith("/v4/search")
         return 200, {
             "status": "success",
@@ -69,7 +85,9 @@ def test_tvdb_search_series__normalizes_series_prefixed_ids(monkeypatch):
 def test_tvdb_series_id__uses_bearer_header(monkeypatch):
     observed_headers = {}
 
-    def mock_request_json(url, parameters=None, body=None, headers=None, cache=True):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
         observed_headers.update(headers or {})
         assert url.endswith("/v4/series/73739/extended")
         return 200, {"data": {"id": 73739, "name": "Series Gamma"}}
@@ -81,3 +99,181 @@ def test_tvdb_series_id__uses_bearer_header(monkeypatch):
     assert observed_headers["Authorization"] == "Bearer token-abc"
     assert result["data"]["id"] == 73739
     assert result["data"]["seriesName"] == "Series Gamma"
+
+
+def test_tvdb_series_id__skips_extended_once_unavailable(monkeypatch):
+    calls = []
+
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        calls.append(url)
+        if url.endswith("/extended"):
+            return 404, {}
+        return 200, {"data": {"id": 73739, "name": "Series Gamma"}}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+    monkeypatch.setattr("mnamer.endpoints._TVDB_EXTENDED_OK", {})
+
+    tvdb_series_id("token-abc", "73739")
+    tvdb_series_id("token-abc", "73739")
+
+    extended_probes = [url for url in calls if url.endswith("/extended")]
+    assert len(extended_probes) == 1  # second call goes straight to base
+
+
+def test_tvdb_series_id__unknown_id_does_not_poison_extended(monkeypatch):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        return 404, {}  # the id itself doesn't exist on either route
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+    capability: dict = {}
+    monkeypatch.setattr("mnamer.endpoints._TVDB_EXTENDED_OK", capability)
+
+    with pytest.raises(MnamerNotFoundException):
+        tvdb_series_id("token-abc", "999999")
+    assert capability == {}  # a 404/404 pair says nothing about the route
+
+
+def test_tvdb_request_first_available__parallel_picks_usable_response(monkeypatch):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        if url.endswith("/extended"):
+            return 404, {}
+        return 200, {"data": {"id": 73739}}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    attempts = [("/series/73739/extended", None), ("/series/73739", None)]
+    status, content = _tvdb_request_first_available(
+        token="token-abc",
+        language=None,
+        cache=True,
+        attempts=attempts,
+        parallel=True,
+    )
+    assert status == 200
+    assert content["data"]["id"] == 73739
+
+
+def test_tvdb_request_first_available__parallel_keeps_fallback(monkeypatch):
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        return 404, {}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    attempts = [("/series/1/extended", None), ("/series/1", None)]
+    status, content = _tvdb_request_first_available(
+        token="token-abc",
+        language=None,
+        cache=True,
+        attempts=attempts,
+        parallel=True,
+    )
+    assert status == 404
+    assert content == {}
+
+
+def test_tvdb_login__reuses_cached_token(tmp_path, monkeypatch):
+    calls = []
+
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        calls.append(url)
+        return 200, {"status": "success", "data": {"token": "jwt-token"}}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+    monkeypatch.setattr("mnamer.endpoints._TOKEN_CACHE", {})
+    monkeypatch.setattr(
+        "mnamer.endpoints._TOKEN_CACHE_PATH", tmp_path / "tvdb_token.json"
+    )
+    monkeypatch.setattr("mnamer.endpoints._token_cache_loaded", True)
+
+    assert tvdb_login("api-key") == "jwt-token"
+    assert tvdb_login("api-key") == "jwt-token"
+    assert len(calls) == 1
+
+
+def test_tvdb_login__persists_token_across_processes(tmp_path, monkeypatch):
+    token_path = tmp_path / "tvdb_token.json"
+
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        return 200, {"status": "success", "data": {"token": "jwt-token"}}
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+    monkeypatch.setattr("mnamer.endpoints._TOKEN_CACHE", {})
+    monkeypatch.setattr("mnamer.endpoints._TOKEN_CACHE_PATH", token_path)
+    monkeypatch.setattr("mnamer.endpoints._token_cache_loaded", True)
+
+    tvdb_login("api-key")
+    assert token_path.exists()
+
+    # simulate a fresh process: empty memory cache, disk not yet loaded
+    monkeypatch.setattr("mnamer.endpoints._TOKEN_CACHE", {})
+    monkeypatch.setattr("mnamer.endpoints._token_cache_loaded", False)
+    monkeypatch.setattr(
+        "mnamer.endpoints.request_json",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("network hit")),
+    )
+    assert tvdb_login("api-key") == "jwt-token"
+
+
+def test_tvdb_search_series__rejects_malformed_imdb_id(monkeypatch):
+    monkeypatch.setattr(
+        "mnamer.endpoints.request_json",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("network hit")),
+    )
+    with pytest.raises(MnamerException):
+        tvdb_search_series("token-123", id_imdb="tt123abc")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        (2, 2),
+        ("3", 3),
+        ("/series/73739/episodes/default/eng?page=2", 2),
+        ("/series/73739/episodes/default/eng?page=2&season=1", 2),
+        ("/search?q=page%3Dfoo&page=4", 4),
+        ("/series/73739/episodes", None),
+        ("/series/73739?page=", None),
+        ("/search?subpage=3", None),
+        ("/search?subpage=3&page=7", 7),
+        (None, None),
+    ),
+)
+def test_tvdb_extract_page(value, expected):
+    assert _tvdb_extract_page(value) == expected
+
+
+def test_tvdb_iter_series_episodes__streams_across_pages(monkeypatch):
+    pages = {
+        1: {
+            "data": {"episodes": [{"id": 1, "name": "One"}, {"id": 2, "name": "Two"}]},
+            "links": {"next": 2, "last": 2},
+        },
+        2: {
+            "data": {"episodes": [{"id": 3, "name": "Three"}]},
+            "links": {"next": None, "last": 2},
+        },
+    }
+
+    def mock_request_json(
+        url, parameters=None, body=None, headers=None, cache=True, pace=None
+    ):
+        page = int(dict(parameters or {}).get("page", 1))
+        return 200, pages[page]
+
+    monkeypatch.setattr("mnamer.endpoints.request_json", mock_request_json)
+
+    episodes = list(tvdb_iter_series_episodes("token-abc", "73739"))
+    assert [entry["id"] for entry in episodes] == [1, 2, 3]
+    assert episodes[0]["episodeName"] == "One"
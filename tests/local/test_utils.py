@@ -642,6 +642,57 @@ def test_request_json__failure(mock_request):
     assert content == {}
 
 
+@patch("mnamer.utils.requests_cache.CachedSession.request")
+def test_request_json__swr_serves_repeat_gets_from_memory(mock_request):
+    mock_request.return_value = MockRequestResponse(200, '{"apple":"pie"}')
+    for _ in range(3):
+        status, content = request_json("http://...", cache=True)
+        assert status == 200
+        assert content == {"apple": "pie"}
+    assert mock_request.call_count == 1
+
+
+@patch("mnamer.utils.requests_cache.CachedSession.request")
+def test_request_json__swr_hits_skip_pacing(mock_request):
+    mock_request.return_value = MockRequestResponse(200, '{"apple":"pie"}')
+    paced = []
+    for _ in range(3):
+        request_json("http://...", cache=True, pace=lambda: paced.append(True))
+    assert paced == [True]  # only the initial fetch pays the rate limit
+
+
+@patch("mnamer.utils.requests_cache.CachedSession.request")
+def test_request_json__swr_skips_uncached_requests(mock_request):
+    mock_request.return_value = MockRequestResponse(200, '{"apple":"pie"}')
+    request_json("http://...", cache=False)
+    request_json("http://...", cache=False)
+    assert mock_request.call_count == 2
+
+
+@patch("mnamer.utils.requests_cache.CachedSession.request")
+def test_request_json__swr_skips_error_responses(mock_request):
+    mock_request.return_value = MockRequestResponse(404, "{}")
+    request_json("http://...", cache=True)
+    request_json("http://...", cache=True)
+    assert mock_request.call_count == 2
+
+
+@patch("mnamer.utils._swr_refresh")
+def test_request_json__swr_stale_entry_served_and_refreshed(mock_refresh):
+    from mnamer import utils
+
+    with patch("mnamer.utils.requests_cache.CachedSession.request") as mock_request:
+        mock_request.return_value = MockRequestResponse(200, '{"apple":"pie"}')
+        request_json("http://...", cache=True)
+        (key, (timestamp, status, content)) = next(iter(utils._swr_cache.items()))
+        utils._swr_cache[key] = (timestamp - utils._SWR_SOFT_TTL - 1, status, content)
+        status, content = request_json("http://...", cache=True)
+    assert status == 200
+    assert content == {"apple": "pie"}
+    assert mock_request.call_count == 1
+    assert mock_refresh.call_count == 1
+
+
 @pytest.mark.parametrize("s", ("()x", "x()", "()[]x", "[]x()()"))
 def test_str_fix_padding__strip_empty_brackets(s: str):
     expected = "x"
@@ -1,9 +1,10 @@
+import sys
 from pathlib import Path
 
 import pytest
 
 from mnamer.setting_store import SettingStore
-from mnamer.watcher import Watcher
+from mnamer.watcher import Watcher, _InotifyReader
 
 pytestmark = pytest.mark.local
 
@@ -50,6 +51,135 @@ def test_watcher__waits_for_settle_time(tmp_path: Path, monkeypatch):
     assert seen == [media_file]
 
 
+def test_watcher__close_write_event_skips_settle_wait(tmp_path: Path):
+    media_file = tmp_path / "show.s01e01.mkv"
+    media_file.write_text("test")
+    seen = []
+    settings = SettingStore(
+        watch_enabled=True,
+        watch_input_directory=tmp_path,
+        watch_settle_seconds=600,
+    )
+    watcher = Watcher(settings, lambda target: seen.append(target.source) or True)
+    watcher._close_seen[str(media_file)] = 0
+
+    assert watcher.run_once() == 1
+    assert seen == [media_file]
+    assert not watcher._close_seen
+
+
+def test_watcher__close_write_event_promotes_pending_file(tmp_path: Path):
+    media_file = tmp_path / "show.s01e01.mkv"
+    media_file.write_text("test")
+    seen = []
+    settings = SettingStore(
+        watch_enabled=True,
+        watch_input_directory=tmp_path,
+        watch_settle_seconds=600,
+    )
+    watcher = Watcher(settings, lambda target: seen.append(target.source) or True)
+
+    assert watcher.run_once() == 0  # queued, waiting out the settle window
+    watcher._close_seen[str(media_file)] = watcher._tick
+    assert watcher.run_once() == 1  # close-write promotes the pending entry
+    assert seen == [media_file]
+
+
+def test_watcher__close_seen_prunes_unscanned_paths(tmp_path: Path):
+    settings = SettingStore(
+        watch_enabled=True,
+        watch_input_directory=tmp_path,
+    )
+    watcher = Watcher(settings, lambda target: True)
+    # as if the close event landed mid-scan for a file the mask filters out
+    watcher._close_seen[str(tmp_path / "notes.nfo")] = watcher._tick + 1
+
+    watcher.run_once()  # stamped this tick: kept for one pass
+    assert watcher._close_seen
+    watcher.run_once()
+    assert not watcher._close_seen
+
+
+def test_watcher__next_wait_tracks_earliest_settle_deadline(
+    tmp_path: Path, monkeypatch
+):
+    media_file = tmp_path / "show.s01e01.mkv"
+    media_file.write_text("test")
+    settings = SettingStore(
+        watch_enabled=True,
+        watch_input_directory=tmp_path,
+        watch_settle_seconds=3,
+        watch_poll_interval=5,
+    )
+    watcher = Watcher(settings, lambda target: True)
+
+    ticks = iter([0.0, 1.0])
+    monkeypatch.setattr("mnamer.watcher.time.monotonic", lambda: next(ticks))
+
+    assert watcher.run_once() == 0
+    assert watcher._next_wait() == 2.0  # deadline at t=3, now t=1
+
+
+def test_watcher__next_wait_defaults_to_poll_interval(tmp_path: Path):
+    settings = SettingStore(
+        watch_enabled=True,
+        watch_input_directory=tmp_path,
+        watch_poll_interval=5,
+    )
+    watcher = Watcher(settings, lambda target: True)
+    assert watcher._next_wait() == 5.0
+
+
+def test_watcher__concurrency_processes_batch_in_one_pass(tmp_path: Path):
+    import threading
+
+    media_files = []
+    for index in range(1, 4):
+        media_file = tmp_path / f"show.s01e0{index}.mkv"
+        media_file.write_text("test")
+        media_files.append(media_file)
+    seen = []
+    lock = threading.Lock()
+    settings = SettingStore(
+        watch_enabled=True,
+        watch_input_directory=tmp_path,
+        watch_settle_seconds=0,
+        watch_concurrency=4,
+    )
+
+    def process_target(target):
+        with lock:
+            seen.append(target.source)
+        return True
+
+    watcher = Watcher(settings, process_target)
+    assert watcher.run_once() == 3
+    assert watcher.run_once() == 0
+    assert sorted(seen) == media_files
+
+
+def test_watcher__multiple_watch_directories(tmp_path: Path):
+    root_a = tmp_path / "a"
+    root_b = tmp_path / "b"
+    root_a.mkdir()
+    root_b.mkdir()
+    media_a = root_a / "show.s01e01.mkv"
+    media_b = root_b / "show.s01e02.mkv"
+    media_a.write_text("test")
+    media_b.write_text("test")
+    seen = []
+    settings = SettingStore(
+        watch_enabled=True,
+        watch_input_directory=[root_a, root_b],
+        watch_settle_seconds=0,
+    )
+    watcher = Watcher(settings, lambda target: seen.append(target.source) or True)
+
+    assert watcher.run_once() == 2
+    assert watcher.run_once() == 0
+    assert sorted(seen) == [media_a, media_b]
+
+
 def test_watcher__cleanup_empty_source_dir_after_processed_move(tmp_path: Path):
     source_dir = tmp_path / "drop" / "release"
     source_dir.mkdir(parents=True)
@@ -116,6 +246,25 @@ def test_watcher__dangerous_cleanup_skips_folders_without_mask_matches(tmp_path:
     assert untouched_dir.exists()
 
 
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is linux-only"
+)
+def test_inotify_reader__wakes_watcher_on_new_file(tmp_path: Path):
+    settings = SettingStore(watch_enabled=True, watch_input_directory=tmp_path)
+    watcher = Watcher(settings, lambda target: True)
+    reader = _InotifyReader(watcher)
+    reader.start()
+    try:
+        (tmp_path / "show.s01e01.mkv").write_text("test")
+        assert watcher._wake.wait(timeout=5)
+        with watcher._events_lock:
+            queued = list(watcher._events)
+        assert any(path.endswith("show.s01e01.mkv") for path in queued)
+    finally:
+        reader.stop()
+        reader.join()
+
+
 def test_watcher__dangerous_cleanup_requires_empty_cleanup_flag(tmp_path: Path):
     source_dir = tmp_path / "drop" / "release"
     source_dir.mkdir(parents=True)